@@ -16,7 +16,7 @@ import time
 import logging
 import asyncio
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -265,12 +265,12 @@ class CircuitBreakerControllerV2:
         glass_floor_tx_id = None
         proof = None
         if self.config['glass_floor']['enabled'] and stress_level >= self.config['glass_floor']['min_stress_for_publish']:
+            market_snapshot = asdict(market_data)
             calculation_data = {
                 'stress_level': stress_level,
-                'factors': { ... }  # abbreviated for brevity
+                'factors': {k: v for k, v in market_snapshot.items() if k != 'timestamp'}
             }
             proof = GlassFloorPublisher.generate_merkle_proof(calculation_data)
-            market_snapshot = { ... }
             glass_floor_tx_id = await GlassFloorPublisher.publish_transparent_event(
                 stress_level, intervention_level, proof, market_snapshot
             )
@@ -0,0 +1,222 @@
+"""Tests for time_horizon_v2 fast paths against their reference implementations."""
+
+import asyncio
+import dataclasses
+
+import numpy as np
+import orjson
+import pytest
+
+from time_horizon_v2 import (
+    CircuitBreakerControllerV2,
+    GlassFloorPublisher,
+    InterventionLevel,
+    MarketData,
+    MarketDataBatch,
+    _calculation_proof,
+)
+
+
+@pytest.fixture
+def controller(tmp_path):
+    with CircuitBreakerControllerV2(history_file=str(tmp_path / "history.json")) as ctl:
+        yield ctl
+
+
+def _random_market_data(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        MarketData(
+            volatility_index=float(rng.uniform(0, 100)),
+            geopolit_risk_score=float(rng.uniform()),
+            sentiment_fragility=float(rng.uniform()),
+            market_velocity=int(rng.integers(0, 300000)),
+            orderbook_imbalance_rate=float(rng.uniform(-1, 1)),
+            etf_flow_spike=float(rng.uniform()),
+            hft_concentration=float(rng.uniform())
+        )
+        for _ in range(n)
+    ]
+
+
+def test_stress_batch_float32_matches_scalar(controller):
+    market_data = _random_market_data(10000)
+    expected = np.array([controller.calculate_stress_level(md) for md in market_data])
+
+    batch = controller.calculate_stress_level_batch(MarketDataBatch.from_list(market_data))
+    assert batch.dtype == np.float32
+    assert np.abs(batch.astype(np.float64) - expected).max() < 1e-4
+
+    # float64 columns passed as a mapping take the same float32 path
+    columns = {
+        f.name: np.array([getattr(md, f.name) for md in market_data])
+        for f in dataclasses.fields(MarketData)
+    }
+    from_mapping = controller.calculate_stress_level_batch(columns)
+    assert np.abs(from_mapping.astype(np.float64) - expected).max() < 1e-4
+
+
+def _reference_proof(stress_level, market_data, sentiment, geopolitical):
+    return GlassFloorPublisher.generate_merkle_proof({
+        'stress_level': stress_level,
+        'volatility': market_data.volatility_index,
+        'velocity': market_data.market_velocity,
+        'sentiment': sentiment,
+        'geopolitical': geopolitical
+    })
+
+
+@pytest.mark.parametrize("stress_level, volatility, velocity, sentiment, geopolitical", [
+    (0.623, 62.3, 120000, 0.8, 0.7),
+    (0.0, 0.0, 0, 0.0, 0.0),
+    (1.0, 100.0, 300000, 1.0, 1.0),
+    (1 / 3, 45.123456789, 85000.5, 0.1 + 0.2, 2 / 3),
+    (np.float64(0.623), np.float64(62.3), np.int64(120000), np.float64(0.8), np.float64(0.7)),
+    (np.float32(0.5), np.float32(45.0), np.int32(100000), np.float32(0.25), np.float32(0.75)),
+    (0.623, np.float32(62.3), 120000, np.float32(0.1), np.float32(0.7)),
+    (np.float32(0.1), 62.3, np.float32(120000.5), 0.8, np.float32(0.7)),
+    (1e-7, 1e17, 120000, 1.5e-5, 0.5),
+    (float('nan'), 62.3, 120000, 0.8, 0.7),
+    (0.5, float('inf'), 120000, float('-inf'), 0.7),
+])
+def test_calculation_proof_matches_merkle_proof(stress_level, volatility, velocity, sentiment, geopolitical):
+    market_data = MarketData(
+        volatility_index=volatility,
+        geopolit_risk_score=geopolitical,
+        sentiment_fragility=sentiment,
+        market_velocity=velocity
+    )
+    assert (_calculation_proof(stress_level, market_data, sentiment, geopolitical)
+            == _reference_proof(stress_level, market_data, sentiment, geopolitical))
+
+
+class _SmallHistoryController(CircuitBreakerControllerV2):
+    """Tiny ring and compaction threshold so wrap and snapshot+log states are cheap to reach."""
+    HISTORY_CAPACITY = 8
+    SNAPSHOT_EVERY = 4
+
+
+_NO_GLASS_FLOOR = {'glass_floor': {'enabled': False, 'min_stress_for_publish': 0.4}}
+
+
+async def _record_ticks(ctl, timestamps):
+    for ts in timestamps:
+        await ctl.evaluate_market_state(MarketData(45.0, 0.5, 0.6, 100000, timestamp=ts))
+
+
+def _abandon(ctl):
+    """Stop the writer without the final snapshot, as the finalizer does."""
+    ctl._hist_stop.set()
+    ctl._hist_writer.join()
+
+
+@pytest.mark.asyncio
+async def test_history_reload_from_snapshot_and_log(tmp_path):
+    history_file = tmp_path / "history.json"
+    ctl = _SmallHistoryController(config=_NO_GLASS_FLOOR, history_file=str(history_file))
+    await _record_ticks(ctl, [float(i) for i in range(6)])
+    expected = ctl.intervention_history
+    _abandon(ctl)
+
+    # Compacted at 4 rows; the last 2 are only in the log
+    assert history_file.exists()
+    assert len((tmp_path / "history.json.log").read_bytes().splitlines()) == 2
+
+    with _SmallHistoryController(config=_NO_GLASS_FLOOR, history_file=str(history_file)) as reloaded:
+        assert reloaded.intervention_history == expected
+
+
+@pytest.mark.asyncio
+async def test_history_ring_wrap_keeps_newest_rows(tmp_path):
+    history_file = str(tmp_path / "history.json")
+    async with _SmallHistoryController(config=_NO_GLASS_FLOOR, history_file=history_file) as ctl:
+        await _record_ticks(ctl, [float(i) for i in range(20)])
+        assert [row[0] for row in ctl.intervention_history] == [float(i) for i in range(12, 20)]
+        expected = ctl.intervention_history
+
+    with _SmallHistoryController(config=_NO_GLASS_FLOOR, history_file=history_file) as reloaded:
+        assert reloaded.intervention_history == expected
+        assert reloaded.history_view()['ts'].tolist() == [float(i) for i in range(12, 20)]
+
+
+@pytest.mark.asyncio
+async def test_history_reload_skips_torn_log_line(tmp_path):
+    history_file = tmp_path / "history.json"
+    ctl = _SmallHistoryController(config=_NO_GLASS_FLOOR, history_file=str(history_file))
+    await _record_ticks(ctl, [float(i) for i in range(6)])
+    expected = ctl.intervention_history
+    _abandon(ctl)
+
+    with open(tmp_path / "history.json.log", 'ab') as f:
+        f.write(b'[6.0,0.5,3,null,"Thrott')
+
+    with _SmallHistoryController(config=_NO_GLASS_FLOOR, history_file=str(history_file)) as reloaded:
+        assert reloaded.intervention_history == expected
+
+
+@pytest.mark.asyncio
+async def test_history_full_queue_does_not_block_evaluation(tmp_path):
+    class TinyQueueController(_SmallHistoryController):
+        HISTORY_QUEUE_SIZE = 2
+
+    ctl = TinyQueueController(config=_NO_GLASS_FLOOR, history_file=str(tmp_path / "history.json"))
+    _abandon(ctl)  # Nothing drains the queue from here on
+
+    await _record_ticks(ctl, [float(i) for i in range(6)])
+    assert ctl._hist_q.full()
+    assert ctl._log_skipped == 4
+    assert [row[0] for row in ctl.intervention_history] == [float(i) for i in range(6)]
+
+
+def test_published_tx_ids_are_in_ledger_without_flush(tmp_path, monkeypatch):
+    ledger = tmp_path / "ledger.jsonl"
+    monkeypatch.setattr(GlassFloorPublisher, "LEDGER_FILE", str(ledger))
+
+    async def publish_all():
+        return await asyncio.gather(*(
+            GlassFloorPublisher.publish_transparent_event(
+                0.9, InterventionLevel.LEVEL_4_GLOBAL_SPEED_LIMIT, "proof", {"i": i}
+            )
+            for i in range(200)
+        ))
+
+    # No flush(): asyncio.run() cancels leftover tasks on exit
+    tx_ids = asyncio.run(publish_all())
+    written = [orjson.loads(line)['tx_id'] for line in ledger.read_bytes().splitlines()]
+    assert sorted(written) == sorted(tx_ids)
+
+
+def test_http_session_follows_event_loop_and_closes_on_sync_close(tmp_path):
+    pytest.importorskip("aiohttp")
+    market_data = MarketData(45.0, 0.5, 0.6, 100000)
+    with CircuitBreakerControllerV2(config=_NO_GLASS_FLOOR, history_file=str(tmp_path / "history.json")) as ctl:
+        asyncio.run(ctl.fetch_real_time_indicators())
+        first = ctl._session
+        ctl._ind_cache = None  # Force a fetch; per-indicator futures are still within their TTL
+        asyncio.run(ctl.evaluate_market_state(market_data))
+        second = ctl._session
+        assert second is not first
+        assert first.closed
+    assert second.closed
+
+
+@pytest.mark.parametrize("columns", [
+    # Misspelled required fields
+    {'volatility_index': [60.0], 'sentiment': [0.99], 'geopolitical': [0.99], 'market_velocity': [1]},
+    # Required field omitted
+    {'volatility_index': [60.0], 'geopolit_risk_score': [0.99], 'sentiment_fragility': [0.99]},
+])
+def test_stress_batch_rejects_bad_columns(controller, columns):
+    with pytest.raises(KeyError):
+        controller.calculate_stress_level_batch(columns)
+
+
+def test_stress_batch_zero_fills_optional_columns(controller):
+    md = MarketData(60.0, 0.99, 0.99, 150000)
+    batch = controller.calculate_stress_level_batch({
+        'volatility_index': [md.volatility_index],
+        'geopolit_risk_score': [md.geopolit_risk_score],
+        'sentiment_fragility': [md.sentiment_fragility],
+        'market_velocity': [md.market_velocity]
+    })
+    assert abs(float(batch[0]) - controller.calculate_stress_level(md)) < 1e-4